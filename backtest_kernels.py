@@ -0,0 +1,62 @@
+"""
+TradeX V3 - Backtest Kernels
+Compiled position simulation over precomputed per-bar decisions
+"""
+
+import numpy as np
+from numba_compat import njit
+
+# Per-bar decision codes
+DECISION_HOLD = 0
+DECISION_BUY = 1
+DECISION_SELL = -1
+
+
+@njit(cache=True)
+def simulate_long_positions(close, decisions, initial_balance, allocation):
+    """Open a long on BUY when flat and close it on SELL; any open position is closed on the last bar
+
+    Returns (entry_index, exit_index, quantity, pnl, final_balance, positions_opened),
+    where the trade arrays hold one entry per closed trade.
+    """
+    n = close.shape[0]
+    max_trades = n // 2 + 1
+    entry_index = np.empty(max_trades, dtype=np.int64)
+    exit_index = np.empty(max_trades, dtype=np.int64)
+    quantity = np.empty(max_trades)
+    pnl = np.empty(max_trades)
+
+    balance = initial_balance
+    positions_opened = 0
+    trade_count = 0
+    in_position = False
+    entry = 0
+    entry_quantity = 0.0
+
+    for i in range(n - 1):
+        if decisions[i] == DECISION_BUY and not in_position:
+            in_position = True
+            entry = i
+            entry_quantity = balance * allocation / close[i]
+            positions_opened += 1
+        elif decisions[i] == DECISION_SELL and in_position:
+            trade_pnl = (close[i] - close[entry]) * entry_quantity
+            balance += trade_pnl
+            entry_index[trade_count] = entry
+            exit_index[trade_count] = i
+            quantity[trade_count] = entry_quantity
+            pnl[trade_count] = trade_pnl
+            trade_count += 1
+            in_position = False
+
+    if in_position and n > 0:
+        trade_pnl = (close[n - 1] - close[entry]) * entry_quantity
+        balance += trade_pnl
+        entry_index[trade_count] = entry
+        exit_index[trade_count] = n - 1
+        quantity[trade_count] = entry_quantity
+        pnl[trade_count] = trade_pnl
+        trade_count += 1
+
+    return (entry_index[:trade_count], exit_index[:trade_count], quantity[:trade_count],
+            pnl[:trade_count], balance, positions_opened)
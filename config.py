@@ -25,6 +25,17 @@ class Config:
     BINANCE_BASE_URL = BINANCE_TESTNET_URL if BINANCE_TESTNET else BINANCE_LIVE_URL
     BINANCE_WS_URL = BINANCE_WS_TESTNET_URL if BINANCE_TESTNET else BINANCE_WS_LIVE_URL
     
+    # API Request Configuration
+    API_CONCURRENCY = 8  # Max symbols fetched concurrently in batch requests
+    TICKER_BATCH_SIZE = 100  # Max symbols per multi-symbol ticker request
+    KLINE_CACHE_DIR = 'cache/klines'  # On-disk cache of closed klines per symbol/interval
+    FEATURE_CACHE_DIR = 'cache/features'  # On-disk cache of backtest indicator frames
+    HTTP_POOL_SIZE = 16  # Keep-alive connections kept open to the REST API
+    HTTP_MAX_RETRIES = 3  # Retries for throttled (429) or failed (5xx) GET requests
+    HTTP_BACKOFF_FACTOR = 0.3  # Exponential backoff base between retries (seconds)
+    HTTP_BACKOFF_JITTER = 0.3  # Random extra delay per retry so clients do not retry in lockstep
+    PRICE_CACHE_TTL = 1.0  # Seconds a fetched ticker price is reused
+    
     # Trading Configuration
     SYMBOL = 'BTCUSDT'
     QUANTITY = 0.001  # Minimum BTC quantity
@@ -37,10 +48,10 @@ class Config:
     MACD_SIGNAL = 9
     BOLLINGER_PERIOD = 20
     BOLLINGER_STD = 2
-    SMA_PERIODS = [20, 50, 200]
+    SMA_PERIODS = (20, 50, 200)
     
     # Multi-Timeframe Analysis
-    TIMEFRAMES = ['1m', '5m', '15m', '1h', '4h', '1d']
+    TIMEFRAMES = ('1m', '5m', '15m', '1h', '4h', '1d')
     TIMEFRAME_WEIGHTS = {
         '1m': 0.05,   # 5% weight for noise filtering
         '5m': 0.15,   # 15% weight for short-term signals
@@ -65,8 +76,8 @@ class Config:
     
     # Ensemble Learning
     ENSEMBLE_MODELS = True  # Use multiple models for better predictions
-    MODEL_TYPES = ['LSTM', 'GRU', 'Transformer']  # Different model architectures
-    ENSEMBLE_WEIGHTS = [0.4, 0.35, 0.25]  # Weight for each model type
+    MODEL_TYPES = ('LSTM', 'GRU', 'Transformer')  # Different model architectures
+    ENSEMBLE_WEIGHTS = (0.4, 0.35, 0.25)  # Weight for each model type
     
     # Feature Engineering
     TECHNICAL_FEATURES = True  # Include technical indicators as features
@@ -83,8 +94,8 @@ class Config:
     # Market Regime Detection
     REGIME_DETECTION = True  # Detect market conditions (trending/ranging/volatile)
     REGIME_ADAPTATION = True  # Adapt strategy based on market regime
-    VOLATILITY_REGIMES = ['LOW', 'MEDIUM', 'HIGH']
-    TREND_REGIMES = ['BULLISH', 'BEARISH', 'SIDEWAYS']
+    VOLATILITY_REGIMES = ('LOW', 'MEDIUM', 'HIGH')
+    TREND_REGIMES = ('BULLISH', 'BEARISH', 'SIDEWAYS')
     
     # Regime-Specific Parameters
     REGIME_PARAMETERS = {
@@ -104,6 +115,7 @@ class Config:
     TAKE_PROFIT_PERCENTAGE = 4.0  # 4% take profit
     MAX_DAILY_TRADES = 15  # Increased for more opportunities
     MAX_DAILY_LOSS = 3.0  # Reduced for better risk control
+    MIN_SIGNAL_STRENGTH = 0.6  # Weakest signal allowed to trade
     
     # Dynamic Position Sizing
     BASE_POSITION_SIZE = 0.02  # 2% of balance per trade
@@ -4,15 +4,59 @@ Fetches historical and live BTC prices via Binance API
 Computes technical indicators (RSI, MACD, Bollinger Bands, Moving Averages)
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import pandas as pd
 import numpy as np
-import ta
 import logging
+import os
+from binance import AsyncClient
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from config import Config
+from indicators import (
+    average_directional_index, average_true_range, moving_average_convergence_divergence,
+    relative_strength_index, rolling_mean_absolute_deviation,
+    rolling_mean_absolute_deviation_vectorized, true_range
+)
+from numba_compat import NUMBA_AVAILABLE
+
+# Kline interval lengths in milliseconds, for paging and window arithmetic
+INTERVAL_MS = {
+    Client.KLINE_INTERVAL_1MINUTE: 60_000,
+    Client.KLINE_INTERVAL_3MINUTE: 180_000,
+    Client.KLINE_INTERVAL_5MINUTE: 300_000,
+    Client.KLINE_INTERVAL_15MINUTE: 900_000,
+    Client.KLINE_INTERVAL_30MINUTE: 1_800_000,
+    Client.KLINE_INTERVAL_1HOUR: 3_600_000,
+    Client.KLINE_INTERVAL_2HOUR: 7_200_000,
+    Client.KLINE_INTERVAL_4HOUR: 14_400_000,
+    Client.KLINE_INTERVAL_6HOUR: 21_600_000,
+    Client.KLINE_INTERVAL_8HOUR: 28_800_000,
+    Client.KLINE_INTERVAL_12HOUR: 43_200_000,
+    Client.KLINE_INTERVAL_1DAY: 86_400_000,
+    Client.KLINE_INTERVAL_3DAY: 259_200_000,
+    Client.KLINE_INTERVAL_1WEEK: 604_800_000
+}
+
+# Maximum klines Binance returns per request
+KLINES_PAGE_LIMIT = 1000
+
+# Bump whenever calculate_technical_indicators changes its output, so cached
+# backtest feature frames computed by an older version are not reused
+INDICATOR_VERSION = 1
+
+
+def to_milliseconds(dt):
+    """Epoch milliseconds of a naive datetime, read as UTC like Binance date strings"""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
 
 class DataRetriever:
     def __init__(self):
@@ -33,39 +77,157 @@ class DataRetriever:
                 self.config.BINANCE_SECRET_KEY
             )
         
+        self._configure_session(self.client.session)
+        
         self.symbol = self.config.SYMBOL
+        self._price_cache = {}  # symbol -> (monotonic fetch time, price)
+        self._last_indicators = None  # (input digest, frame) of the most recent indicator run
         self.logger.info(f"Data Retriever initialized for {self.symbol}")
     
-    def get_historical_data(self, hours=24):
-        """Fetch historical BTC price data"""
+    def _configure_session(self, session):
+        """Size the client's keep-alive pool and retry throttled/failed GETs with backoff"""
+        retry = Retry(
+            total=self.config.HTTP_MAX_RETRIES,
+            backoff_factor=self.config.HTTP_BACKOFF_FACTOR,
+            backoff_jitter=self.config.HTTP_BACKOFF_JITTER,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.HTTP_POOL_SIZE,
+            pool_maxsize=self.config.HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+    
+    def _klines_to_df(self, klines):
+        """Convert raw Binance klines to an OHLCV DataFrame"""
+        # One 2-D object array, then a single C-level cast per dtype; the
+        # trailing 'ignore' field is dropped
+        raw = np.array(klines, dtype=object) if klines else np.empty((0, 12), dtype=object)
+        open_, high, low, close, volume, quote_volume, taker_base_volume, taker_quote_volume = (
+            raw[:, [1, 2, 3, 4, 5, 7, 9, 10]].astype(np.float64).T
+        )
+        open_time, close_time, number_of_trades = raw[:, [0, 6, 8]].astype(np.int64).T
+        
+        return pd.DataFrame({
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume,
+            'close_time': close_time,
+            'quote_asset_volume': quote_volume,
+            'number_of_trades': number_of_trades,
+            'taker_buy_base_asset_volume': taker_base_volume,
+            'taker_buy_quote_asset_volume': taker_quote_volume
+        }, index=pd.DatetimeIndex(open_time.astype('datetime64[ms]'), name='timestamp'))
+    
+    def _kline_cache_path(self, symbol, interval):
+        """Path of the on-disk cache of closed klines for a symbol/interval"""
+        return os.path.join(self.config.KLINE_CACHE_DIR, f"{symbol}_{interval}.pkl")
+    
+    def _load_cached_klines(self, symbol, interval):
+        """Load cached closed klines, or None if there is no usable cache"""
+        path = self._kline_cache_path(symbol, interval)
+        if not os.path.exists(path):
+            return None
         try:
-            # Calculate start time
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=hours)
-            
-            # Fetch klines (candlestick data)
-            klines = self.client.get_historical_klines(
-                self.symbol,
-                Client.KLINE_INTERVAL_1HOUR,
-                start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                end_time.strftime('%Y-%m-%d %H:%M:%S')
+            df = pd.read_pickle(path)
+            return df if not df.empty else None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable kline cache {path}: {e}")
+            return None
+    
+    def _store_cached_klines(self, symbol, interval, df):
+        """Persist closed klines; the candle still forming is never cached"""
+        try:
+            closed = df[df['close_time'] < int(time.time() * 1000)]
+            if closed.empty:
+                return
+            os.makedirs(self.config.KLINE_CACHE_DIR, exist_ok=True)
+            path = self._kline_cache_path(symbol, interval)
+            tmp_path = f"{path}.tmp"
+            closed.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Could not update kline cache: {e}")
+    
+    def _merge_klines(self, cached, fresh, step):
+        """Merge freshly fetched klines into the cached range"""
+        if cached is None:
+            return fresh
+        if fresh.empty:
+            return cached
+        
+        # Disjoint ranges would leave a hole in the cache; keep the newer one
+        if fresh.index[0] > cached.index[-1] + step or fresh.index[-1] < cached.index[0] - step:
+            return fresh
+        
+        combined = pd.concat([cached, fresh])
+        return combined[~combined.index.duplicated(keep='last')].sort_index()
+    
+    def _fetch_klines_page(self, symbol, interval, start_ms, end_ms):
+        """Fetch one page of klines in [start_ms, end_ms]"""
+        return self.client.get_klines(
+            symbol=symbol,
+            interval=interval,
+            startTime=start_ms,
+            endTime=end_ms,
+            limit=KLINES_PAGE_LIMIT
+        )
+    
+    def _fetch_klines(self, symbol, interval, start_ms, end_ms):
+        """Fetch klines in [start_ms, end_ms], requesting time-bounded pages concurrently"""
+        # Each page covers at most KLINES_PAGE_LIMIT intervals, so page bounds are
+        # known up front and pages do not depend on each other
+        page_span = KLINES_PAGE_LIMIT * INTERVAL_MS[interval]
+        pages = [
+            (page_start, min(page_start + page_span - 1, end_ms))
+            for page_start in range(start_ms, end_ms + 1, page_span)
+        ]
+        if len(pages) <= 1:
+            return self._fetch_klines_page(symbol, interval, start_ms, end_ms)
+        
+        with ThreadPoolExecutor(max_workers=min(len(pages), self.config.API_CONCURRENCY)) as executor:
+            results = executor.map(
+                lambda page: self._fetch_klines_page(symbol, interval, *page), pages
             )
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-            
-            # Convert price columns to float
-            price_columns = ['open', 'high', 'low', 'close', 'volume']
-            for col in price_columns:
-                df[col] = df[col].astype(float)
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            return [kline for page in results for kline in page]
+    
+    def get_historical_data(self, hours=24, symbol=None, start_time=None, end_time=None):
+        """Fetch historical BTC price data"""
+        try:
+            symbol = symbol or self.symbol
+            interval = Client.KLINE_INTERVAL_1HOUR
+            step = timedelta(milliseconds=INTERVAL_MS[interval])
+            
+            # Calculate time window (explicit bounds may be datetimes or date strings)
+            end_time = pd.Timestamp(end_time).to_pydatetime() if end_time is not None else datetime.now()
+            if start_time is not None:
+                start_time = pd.Timestamp(start_time).to_pydatetime()
+            else:
+                start_time = end_time - timedelta(hours=hours)
+            
+            # Only request the klines the closed-kline cache does not already hold
+            cached = self._load_cached_klines(symbol, interval)
+            if cached is not None and cached.index[0] < start_time + step:
+                fetch_from = max(start_time, cached.index[-1] + step)
+            else:
+                fetch_from = start_time
+            
+            if fetch_from <= end_time:
+                # Fetch klines (candlestick data)
+                klines = self._fetch_klines(
+                    symbol, interval, to_milliseconds(fetch_from), to_milliseconds(end_time)
+                )
+                df = self._merge_klines(cached, self._klines_to_df(klines), step)
+                self._store_cached_klines(symbol, interval, df)
+            else:
+                df = cached
+            
+            df = df.loc[start_time:end_time]
             
             self.logger.info(f"Retrieved {len(df)} historical data points")
             return df
@@ -77,31 +239,108 @@ class DataRetriever:
             self.logger.error(f"Error fetching historical data: {e}")
             return None
     
-    def get_current_price(self):
+    def _feature_cache_path(self, symbol, interval, start_time, end_time):
+        """Path of the cached indicator frame for a symbol/interval/date range"""
+        key = f"{symbol}|{interval}|{start_time.isoformat()}|{end_time.isoformat()}|{INDICATOR_VERSION}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.config.FEATURE_CACHE_DIR, f"{digest}.pkl")
+    
+    def get_historical_indicators(self, start_time, end_time, symbol=None):
+        """Fetch historical data with indicators, cached on disk for closed date ranges"""
+        try:
+            symbol = symbol or self.symbol
+            interval = Client.KLINE_INTERVAL_1HOUR
+            start_time = pd.Timestamp(start_time).to_pydatetime()
+            end_time = pd.Timestamp(end_time).to_pydatetime()
+            
+            # A range reaching the candle still forming can change between runs
+            cacheable = end_time + timedelta(milliseconds=INTERVAL_MS[interval]) <= datetime.now(timezone.utc).replace(tzinfo=None)
+            path = self._feature_cache_path(symbol, interval, start_time, end_time)
+            if cacheable and os.path.exists(path):
+                try:
+                    df = pd.read_pickle(path)
+                    self.logger.info(f"Loaded {len(df)} cached indicator rows")
+                    return df
+                except Exception as e:
+                    self.logger.warning(f"Ignoring unreadable feature cache {path}: {e}")
+            
+            df = self.get_historical_data(symbol=symbol, start_time=start_time, end_time=end_time)
+            if df is None or df.empty:
+                return df
+            
+            # Indicators only look backwards, so computing them once over the whole
+            # history gives every bar the same values as recomputing on each prefix
+            df = self.calculate_technical_indicators(df)
+            if df is not None and cacheable:
+                try:
+                    os.makedirs(self.config.FEATURE_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{path}.tmp"
+                    df.to_pickle(tmp_path)
+                    os.replace(tmp_path, path)
+                except Exception as e:
+                    self.logger.warning(f"Could not update feature cache: {e}")
+            
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching historical indicators: {e}")
+            return None
+    
+    def get_current_price(self, symbol=None):
         """Get current BTC price"""
         try:
-            ticker = self.client.get_symbol_ticker(symbol=self.symbol)
-            return float(ticker['price'])
+            symbol = symbol or self.symbol
+            
+            # Reuse a price fetched within the last PRICE_CACHE_TTL seconds
+            cached = self._price_cache.get(symbol)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self.config.PRICE_CACHE_TTL:
+                return cached[1]
+            
+            ticker = self.client.get_symbol_ticker(symbol=symbol)
+            price = float(ticker['price'])
+            self._price_cache[symbol] = (now, price)
+            return price
         except Exception as e:
             self.logger.error(f"Error fetching current price: {e}")
             return None
     
-    def get_24h_stats(self):
-        """Get 24-hour statistics"""
+    def _parse_24h_stats(self, stats):
+        """Convert a raw 24hr ticker response to a stats dictionary"""
+        return {
+            'price_change': float(stats['priceChange']),
+            'price_change_percent': float(stats['priceChangePercent']),
+            'volume': float(stats['volume']),
+            'quote_volume': float(stats['quoteVolume']),
+            'high_24h': float(stats['highPrice']),
+            'low_24h': float(stats['lowPrice']),
+            'count': int(stats['count'])
+        }
+    
+    def _ticker_batches(self, symbols):
+        """Split symbols into JSON arrays accepted by the multi-symbol ticker endpoint"""
+        batch_size = self.config.TICKER_BATCH_SIZE
+        return [
+            json.dumps(list(symbols[i:i + batch_size]), separators=(',', ':'))
+            for i in range(0, len(symbols), batch_size)
+        ]
+    
+    def get_24h_stats_multi(self, symbols):
+        """Get 24-hour statistics for several symbols with one request per batch"""
         try:
-            stats = self.client.get_ticker(symbol=self.symbol)
-            return {
-                'price_change': float(stats['priceChange']),
-                'price_change_percent': float(stats['priceChangePercent']),
-                'volume': float(stats['volume']),
-                'quote_volume': float(stats['quoteVolume']),
-                'high_24h': float(stats['highPrice']),
-                'low_24h': float(stats['lowPrice']),
-                'count': int(stats['count'])
-            }
+            stats = {}
+            for batch in self._ticker_batches(symbols):
+                for ticker in self.client.get_ticker(symbols=batch):
+                    stats[ticker['symbol']] = self._parse_24h_stats(ticker)
+            return stats
         except Exception as e:
             self.logger.error(f"Error fetching 24h stats: {e}")
-            return None
+            return {}
+    
+    def get_24h_stats(self, symbol=None):
+        """Get 24-hour statistics"""
+        symbol = symbol or self.symbol
+        return self.get_24h_stats_multi([symbol]).get(symbol)
     
     def calculate_technical_indicators(self, df):
         """Calculate technical indicators"""
@@ -109,106 +348,142 @@ class DataRetriever:
             if df is None or df.empty:
                 return None
             
-            # Create a copy to avoid modifying original data
-            df_indicators = df.copy()
-            
-            # RSI
-            df_indicators['rsi'] = ta.momentum.RSIIndicator(
-                df_indicators['close'], 
-                window=self.config.RSI_PERIOD
-            ).rsi()
-            
-            # MACD
-            macd = ta.trend.MACD(
-                df_indicators['close'],
-                window_fast=self.config.MACD_FAST,
-                window_slow=self.config.MACD_SLOW,
-                window_sign=self.config.MACD_SIGNAL
+            # Polls often see unchanged klines; reuse the last result when the
+            # timestamps and every input column hash the same
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(df.index.asi8.tobytes())
+            for column in df.columns:
+                digest.update(column.encode())
+                digest.update(df[column].to_numpy().tobytes())
+            key = digest.digest()
+            if self._last_indicators is not None and self._last_indicators[0] == key:
+                return self._last_indicators[1]
+            
+            # Extract the input series once and share them across indicators
+            close = df['close']
+            high = df['high']
+            low = df['low']
+            volume = df['volume']
+            
+            # Collect every indicator first and attach them in a single assign
+            indicators = {}
+            
+            # Simple moving averages, computed once per period and shared
+            # with the Bollinger middle band
+            sma_periods = set(self.config.SMA_PERIODS) | {self.config.BOLLINGER_PERIOD}
+            sma = {
+                period: close.rolling(window=period, min_periods=period).mean()
+                for period in sma_periods
+            }
+            
+            close_values = close.to_numpy(dtype=np.float64)
+            
+            # RSI (Wilder smoothing of gains and losses)
+            indicators['rsi'] = pd.Series(
+                relative_strength_index(close_values, self.config.RSI_PERIOD), index=df.index
             )
-            df_indicators['macd'] = macd.macd()
-            df_indicators['macd_signal'] = macd.macd_signal()
-            df_indicators['macd_histogram'] = macd.macd_diff()
-            
-            # Bollinger Bands
-            bollinger = ta.volatility.BollingerBands(
-                df_indicators['close'],
-                window=self.config.BOLLINGER_PERIOD,
-                window_dev=self.config.BOLLINGER_STD
+            
+            # MACD derived from one fast and one slow EMA pass
+            macd, macd_signal, macd_histogram = moving_average_convergence_divergence(
+                close_values, self.config.MACD_FAST, self.config.MACD_SLOW, self.config.MACD_SIGNAL
             )
-            df_indicators['bb_upper'] = bollinger.bollinger_hband()
-            df_indicators['bb_middle'] = bollinger.bollinger_mavg()
-            df_indicators['bb_lower'] = bollinger.bollinger_lband()
-            df_indicators['bb_width'] = bollinger.bollinger_wband()
-            df_indicators['bb_percent'] = bollinger.bollinger_pband()
+            indicators['macd'] = pd.Series(macd, index=df.index)
+            indicators['macd_signal'] = pd.Series(macd_signal, index=df.index)
+            indicators['macd_histogram'] = pd.Series(macd_histogram, index=df.index)
+            
+            # Bollinger Bands around the shared SMA
+            bb_middle = sma[self.config.BOLLINGER_PERIOD]
+            bb_std = close.rolling(
+                window=self.config.BOLLINGER_PERIOD, min_periods=self.config.BOLLINGER_PERIOD
+            ).std(ddof=0)
+            bb_upper = bb_middle + self.config.BOLLINGER_STD * bb_std
+            bb_lower = bb_middle - self.config.BOLLINGER_STD * bb_std
+            indicators['bb_upper'] = bb_upper
+            indicators['bb_middle'] = bb_middle
+            indicators['bb_lower'] = bb_lower
+            indicators['bb_width'] = (bb_upper - bb_lower) / bb_middle * 100
+            indicators['bb_percent'] = (close - bb_lower) / (bb_upper - bb_lower)
             
             # Moving Averages
             for period in self.config.SMA_PERIODS:
-                df_indicators[f'sma_{period}'] = ta.trend.SMAIndicator(
-                    df_indicators['close'], 
-                    window=period
-                ).sma_indicator()
+                indicators[f'sma_{period}'] = sma[period]
             
             # Volume indicators
-            df_indicators['volume_sma'] = ta.trend.SMAIndicator(
-                df_indicators['volume'], 
-                window=20
-            ).sma_indicator()
+            indicators['volume_sma'] = volume.rolling(window=20, min_periods=20).mean()
             
             # Price position relative to Bollinger Bands
-            df_indicators['bb_position'] = (
-                (df_indicators['close'] - df_indicators['bb_lower']) / 
-                (df_indicators['bb_upper'] - df_indicators['bb_lower'])
-            )
+            indicators['bb_position'] = indicators['bb_percent']
             
             # Advanced Indicators
+            # Rolling extremes, shared by Stochastic and Williams %R
+            highest_high = {}
+            lowest_low = {}
+            for window in {self.config.STOCHASTIC_K, self.config.WILLIAMS_R_PERIOD}:
+                highest_high[window] = high.rolling(window=window, min_periods=window).max()
+                lowest_low[window] = low.rolling(window=window, min_periods=window).min()
+            
             # Stochastic
-            stoch = ta.momentum.StochasticOscillator(
-                df_indicators['high'], df_indicators['low'], df_indicators['close'], 
-                window=self.config.STOCHASTIC_K, 
-                smooth_window=self.config.STOCHASTIC_D
-            )
-            df_indicators['stoch_k'] = stoch.stoch()
-            df_indicators['stoch_d'] = stoch.stoch_signal()
+            stoch_high = highest_high[self.config.STOCHASTIC_K]
+            stoch_low = lowest_low[self.config.STOCHASTIC_K]
+            indicators['stoch_k'] = 100 * (close - stoch_low) / (stoch_high - stoch_low)
+            indicators['stoch_d'] = indicators['stoch_k'].rolling(
+                window=self.config.STOCHASTIC_D, min_periods=self.config.STOCHASTIC_D
+            ).mean()
             
             # Williams %R
-            df_indicators['williams_r'] = ta.momentum.WilliamsRIndicator(
-                df_indicators['high'], df_indicators['low'], df_indicators['close'], 
-                window=self.config.WILLIAMS_R_PERIOD
-            ).williams_r()
+            williams_high = highest_high[self.config.WILLIAMS_R_PERIOD]
+            williams_low = lowest_low[self.config.WILLIAMS_R_PERIOD]
+            indicators['williams_r'] = -100 * (williams_high - close) / (williams_high - williams_low)
+            
+            # CCI (Commodity Channel Index); the mean deviation comes from a
+            # compiled kernel, or a vectorized window view when numba is missing
+            typical_price = (high + low + close) / 3.0
+            tp_mean = typical_price.rolling(
+                window=self.config.CCI_PERIOD, min_periods=self.config.CCI_PERIOD
+            ).mean()
+            mad_function = (
+                rolling_mean_absolute_deviation if NUMBA_AVAILABLE
+                else rolling_mean_absolute_deviation_vectorized
+            )
+            mean_deviation = mad_function(
+                typical_price.to_numpy(dtype=np.float64), self.config.CCI_PERIOD
+            )
+            indicators['cci'] = (typical_price - tp_mean) / (0.015 * mean_deviation)
             
-            # CCI (Commodity Channel Index)
-            df_indicators['cci'] = ta.trend.CCIIndicator(
-                df_indicators['high'], df_indicators['low'], df_indicators['close'], 
-                window=self.config.CCI_PERIOD
-            ).cci()
+            high_values = high.to_numpy(dtype=np.float64)
+            low_values = low.to_numpy(dtype=np.float64)
+            
+            # One true-range pass shared by ADX and ATR
+            tr = true_range(high_values, low_values, close_values)
             
             # ADX (Average Directional Index)
-            adx = ta.trend.ADXIndicator(
-                df_indicators['high'], df_indicators['low'], df_indicators['close'], 
-                window=self.config.ADX_PERIOD
+            adx, adx_pos, adx_neg = average_directional_index(
+                high_values, low_values, tr, self.config.ADX_PERIOD
             )
-            df_indicators['adx'] = adx.adx()
-            df_indicators['adx_pos'] = adx.adx_pos()
-            df_indicators['adx_neg'] = adx.adx_neg()
+            indicators['adx'] = pd.Series(adx, index=df.index)
+            indicators['adx_pos'] = pd.Series(adx_pos, index=df.index)
+            indicators['adx_neg'] = pd.Series(adx_neg, index=df.index)
             
             # ATR (Average True Range)
-            df_indicators['atr'] = ta.volatility.AverageTrueRange(
-                df_indicators['high'], df_indicators['low'], df_indicators['close'], 
-                window=self.config.ATR_PERIOD
-            ).average_true_range()
+            indicators['atr'] = pd.Series(
+                average_true_range(tr, self.config.ATR_PERIOD), index=df.index
+            )
             
             # Volume Analysis
-            df_indicators['volume_ratio'] = df_indicators['volume'] / df_indicators['volume_sma']
-            df_indicators['volume_trend'] = df_indicators['volume'].pct_change()
+            indicators['volume_ratio'] = volume / indicators['volume_sma']
+            indicators['volume_trend'] = volume.pct_change()
             
             # Price Action Patterns
-            df_indicators['price_trend'] = df_indicators['close'].pct_change()
-            df_indicators['price_acceleration'] = df_indicators['price_trend'].diff()
-            df_indicators['volatility'] = df_indicators['close'].rolling(window=20).std()
+            indicators['price_trend'] = close.pct_change()
+            indicators['price_acceleration'] = indicators['price_trend'].diff()
+            indicators['volatility'] = close.rolling(window=20).std()
             
             # Support and Resistance Levels
-            df_indicators['support_level'] = df_indicators['low'].rolling(window=20).min()
-            df_indicators['resistance_level'] = df_indicators['high'].rolling(window=20).max()
+            indicators['support_level'] = low.rolling(window=20).min()
+            indicators['resistance_level'] = high.rolling(window=20).max()
+            
+            df_indicators = df.assign(**indicators)
+            self._last_indicators = (key, df_indicators)
             
             self.logger.info("Technical indicators calculated successfully")
             return df_indicators
@@ -217,22 +492,29 @@ class DataRetriever:
             self.logger.error(f"Error calculating technical indicators: {e}")
             return None
     
-    def get_market_data(self):
+    def get_market_data(self, symbol=None):
         """Get comprehensive market data with indicators"""
         try:
-            # Get historical data
-            df = self.get_historical_data(hours=self.config.ML_LOOKBACK_HOURS)
-            if df is None:
-                return None
-            
-            # Calculate technical indicators
-            df_with_indicators = self.calculate_technical_indicators(df)
-            if df_with_indicators is None:
-                return None
-            
-            # Get current price and 24h stats
-            current_price = self.get_current_price()
-            stats_24h = self.get_24h_stats()
+            symbol = symbol or self.symbol
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Current price and 24h stats are independent requests; run them
+                # while the klines are fetched and the indicators computed here
+                price_future = executor.submit(self.get_current_price, symbol)
+                stats_future = executor.submit(self.get_24h_stats, symbol)
+                
+                # Get historical data
+                df = self.get_historical_data(hours=self.config.ML_LOOKBACK_HOURS, symbol=symbol)
+                if df is None:
+                    return None
+                
+                # Calculate technical indicators
+                df_with_indicators = self.calculate_technical_indicators(df)
+                if df_with_indicators is None:
+                    return None
+                
+                current_price = price_future.result()
+                stats_24h = stats_future.result()
             
             # Create market data dictionary
             market_data = {
@@ -240,7 +522,7 @@ class DataRetriever:
                 'current_price': current_price,
                 'stats_24h': stats_24h,
                 'timestamp': datetime.now(),
-                'symbol': self.symbol
+                'symbol': symbol
             }
             
             return market_data
@@ -249,31 +531,92 @@ class DataRetriever:
             self.logger.error(f"Error getting market data: {e}")
             return None
     
-    def get_latest_indicators(self):
-        """Get latest technical indicator values"""
+    def get_market_data_batch(self, symbols):
+        """Get market data for several symbols concurrently"""
         try:
-            market_data = self.get_market_data()
-            if market_data is None or market_data['dataframe'].empty:
+            return asyncio.run(self._get_market_data_batch_async(symbols))
+        except Exception as e:
+            self.logger.error(f"Error getting batch market data: {e}")
+            return {}
+    
+    async def _get_market_data_batch_async(self, symbols):
+        """Fetch all symbols over one async client, bounded by API_CONCURRENCY"""
+        client = await AsyncClient.create(
+            self.config.BINANCE_API_KEY,
+            self.config.BINANCE_SECRET_KEY,
+            testnet=self.config.BINANCE_TESTNET
+        )
+        semaphore = asyncio.Semaphore(self.config.API_CONCURRENCY)
+        
+        try:
+            # 24h stats for every symbol come from the multi-symbol ticker endpoint
+            stats_24h = {}
+            for batch in self._ticker_batches(symbols):
+                for ticker in await client.get_ticker(symbols=batch):
+                    stats_24h[ticker['symbol']] = self._parse_24h_stats(ticker)
+            
+            results = await asyncio.gather(
+                *[self._get_market_data_async(client, semaphore, symbol, stats_24h.get(symbol))
+                  for symbol in symbols]
+            )
+        finally:
+            await client.close_connection()
+        
+        return dict(zip(symbols, results))
+    
+    async def _get_market_data_async(self, client, semaphore, symbol, stats_24h):
+        """Get market data for one symbol, issuing its requests concurrently"""
+        try:
+            end_time = datetime.now()
+            start_time = end_time - timedelta(hours=self.config.ML_LOOKBACK_HOURS)
+            
+            # The lookback window fits in a single klines page
+            async with semaphore:
+                klines, ticker = await asyncio.gather(
+                    client.get_klines(
+                        symbol=symbol,
+                        interval=Client.KLINE_INTERVAL_1HOUR,
+                        startTime=to_milliseconds(start_time),
+                        endTime=to_milliseconds(end_time),
+                        limit=KLINES_PAGE_LIMIT
+                    ),
+                    client.get_symbol_ticker(symbol=symbol)
+                )
+            
+            df_with_indicators = self.calculate_technical_indicators(self._klines_to_df(klines))
+            if df_with_indicators is None:
                 return None
             
-            df = market_data['dataframe']
-            latest = df.iloc[-1]
-            
-            indicators = {
-                'rsi': latest['rsi'],
-                'macd': latest['macd'],
-                'macd_signal': latest['macd_signal'],
-                'macd_histogram': latest['macd_histogram'],
-                'bb_position': latest['bb_position'],
-                'bb_width': latest['bb_width'],
-                'price_trend': latest['price_trend'],
-                'volume_trend': latest['volume_trend'],
-                'current_price': market_data['current_price']
+            return {
+                'dataframe': df_with_indicators,
+                'current_price': float(ticker['price']),
+                'stats_24h': stats_24h,
+                'timestamp': datetime.now(),
+                'symbol': symbol
             }
             
-            # Add moving averages
-            for period in self.config.SMA_PERIODS:
-                indicators[f'sma_{period}'] = latest[f'sma_{period}']
+        except Exception as e:
+            self.logger.error(f"Error getting market data for {symbol}: {e}")
+            return None
+    
+    def get_latest_indicators(self, market_data=None):
+        """Get latest technical indicator values, reusing market_data when given"""
+        try:
+            if market_data is None:
+                market_data = self.get_market_data()
+            if market_data is None or market_data['dataframe'].empty:
+                return None
+            
+            df = market_data['dataframe']
+            columns = [
+                'rsi', 'macd', 'macd_signal', 'macd_histogram', 'bb_position',
+                'bb_width', 'price_trend', 'volume_trend'
+            ] + [f'sma_{period}' for period in self.config.SMA_PERIODS]
+            
+            # Read the last value straight from each column instead of
+            # materializing a mixed-dtype row Series with df.iloc[-1]
+            indicators = {column: df[column].iat[-1] for column in columns}
+            indicators['current_price'] = market_data['current_price']
             
             return indicators
             
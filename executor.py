@@ -13,13 +13,15 @@ from binance.exceptions import BinanceAPIException
 from config import Config
 
 class Executor:
-    def __init__(self):
-        """Initialize Executor"""
+    def __init__(self, client=None):
+        """Initialize Executor, optionally sharing an existing Binance client"""
         self.config = Config()
         self.logger = logging.getLogger(__name__)
         
-        # Initialize Binance client
-        if self.config.BINANCE_TESTNET:
+        # Initialize Binance client (a shared client reuses its connection pool)
+        if client is not None:
+            self.client = client
+        elif self.config.BINANCE_TESTNET:
             self.client = Client(
                 self.config.BINANCE_API_KEY, 
                 self.config.BINANCE_SECRET_KEY,
@@ -0,0 +1,161 @@
+"""
+TradeX V3 - Indicator Kernels
+Compiled loops for recursive indicators that cannot be expressed as
+vectorized pandas/NumPy operations
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numba_compat import njit
+
+
+@njit(cache=True)
+def true_range(high, low, close):
+    """True range; the first bar has no previous close and uses high - low"""
+    n = high.shape[0]
+    tr = np.empty(n)
+    if n == 0:
+        return tr
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        tr[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    return tr
+
+
+@njit(cache=True)
+def average_true_range(tr, window):
+    """Wilder ATR seeded with the mean of the first window true ranges (zeros before)"""
+    n = tr.shape[0]
+    atr = np.zeros(n)
+    if n < window:
+        return atr
+    atr[window - 1] = tr[:window].mean()
+    for i in range(window, n):
+        atr[i] = (atr[i - 1] * (window - 1) + tr[i]) / window
+    return atr
+
+
+@njit(cache=True)
+def rolling_mean_absolute_deviation(x, window):
+    """Mean absolute deviation of each full window around its own mean"""
+    n = x.shape[0]
+    mad = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        start = i - window + 1
+        mean = 0.0
+        for j in range(start, i + 1):
+            mean += x[j]
+        mean /= window
+        deviation = 0.0
+        for j in range(start, i + 1):
+            deviation += abs(x[j] - mean)
+        mad[i] = deviation / window
+    return mad
+
+
+def rolling_mean_absolute_deviation_vectorized(x, window):
+    """NumPy rolling_mean_absolute_deviation over a strided window view, for when numba is missing"""
+    mad = np.full(x.shape[0], np.nan)
+    if x.shape[0] < window:
+        return mad
+    windows = sliding_window_view(x, window)
+    means = windows.mean(axis=1, keepdims=True)
+    mad[window - 1:] = np.abs(windows - means).mean(axis=1)
+    return mad
+
+
+@njit(cache=True)
+def average_directional_index(high, low, tr, window):
+    """Wilder ADX with +DI/-DI from precomputed true ranges; NaN until enough bars have been smoothed"""
+    n = high.shape[0]
+    adx = np.full(n, np.nan)
+    plus_di = np.full(n, np.nan)
+    minus_di = np.full(n, np.nan)
+    if n <= window:
+        return adx, plus_di, minus_di
+
+    tr_sum = 0.0
+    plus_sum = 0.0
+    minus_sum = 0.0
+    dx = np.zeros(n)
+    for i in range(1, n):
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        # Seed the smoothed sums with the first window movements, then Wilder-smooth
+        if i <= window:
+            tr_sum += tr[i]
+            plus_sum += plus_dm
+            minus_sum += minus_dm
+            if i < window:
+                continue
+        else:
+            tr_sum = tr_sum - tr_sum / window + tr[i]
+            plus_sum = plus_sum - plus_sum / window + plus_dm
+            minus_sum = minus_sum - minus_sum / window + minus_dm
+
+        if tr_sum != 0:
+            plus_di[i] = 100.0 * plus_sum / tr_sum
+            minus_di[i] = 100.0 * minus_sum / tr_sum
+        else:
+            plus_di[i] = 0.0
+            minus_di[i] = 0.0
+        di_sum = plus_di[i] + minus_di[i]
+        dx[i] = 100.0 * abs(plus_di[i] - minus_di[i]) / di_sum if di_sum != 0 else 0.0
+
+        # ADX starts as the mean of the first window DX values
+        if i == 2 * window - 1:
+            adx[i] = dx[window:i + 1].mean()
+        elif i > 2 * window - 1:
+            adx[i] = (adx[i - 1] * (window - 1) + dx[i]) / window
+
+    return adx, plus_di, minus_di
+
+
+@njit(cache=True)
+def exponential_moving_average(x, alpha, min_periods):
+    """Recursive EMA like pandas ewm(adjust=False); leading NaNs are skipped"""
+    n = x.shape[0]
+    ema = np.full(n, np.nan)
+    value = np.nan
+    count = 0
+    for i in range(n):
+        if not np.isnan(x[i]):
+            count += 1
+            value = x[i] if count == 1 else value + alpha * (x[i] - value)
+        if count >= min_periods:
+            ema[i] = value
+    return ema
+
+
+@njit(cache=True)
+def relative_strength_index(close, window):
+    """Wilder RSI from one pass over gains and losses; NaN until window bars"""
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    alpha = 1.0 / window
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        # The first bar has no change and seeds both averages with zero
+        delta = close[i] - close[i - 1] if i > 0 else 0.0
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain += alpha * (gain - avg_gain)
+        avg_loss += alpha * (loss - avg_loss)
+        if i >= window - 1:
+            rsi[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi
+
+
+@njit(cache=True)
+def moving_average_convergence_divergence(close, fast, slow, signal):
+    """MACD line, signal line and histogram from span-based EMAs"""
+    ema_fast = exponential_moving_average(close, 2.0 / (fast + 1), fast)
+    ema_slow = exponential_moving_average(close, 2.0 / (slow + 1), slow)
+    macd = ema_fast - ema_slow
+    macd_signal = exponential_moving_average(macd, 2.0 / (signal + 1), signal)
+    return macd, macd_signal, macd - macd_signal
@@ -135,7 +135,8 @@ class LogicEngine:
                 return {'signal': 'HOLD', 'confidence': 0.5, 'reason': 'Insufficient price data'}
             
             # Calculate trend
-            price_change = (recent_prices.iloc[-1] - recent_prices.iloc[0]) / recent_prices.iloc[0]
+            first_price = recent_prices.iat[0]
+            price_change = (recent_prices.iat[-1] - first_price) / first_price
             
             # Determine trend signal
             if price_change > 0.02:  # 2% uptrend
@@ -158,6 +159,104 @@ class LogicEngine:
             self.logger.error(f"Error analyzing trend: {e}")
             return {'signal': 'HOLD', 'confidence': 0.5, 'reason': f'Error: {e}'}
     
+    def analyze_technical_indicators_history(self, df):
+        """Vectorized analyze_technical_indicators for every row of an indicator frame"""
+        try:
+            signal_names = np.array(['BUY', 'SELL', 'HOLD'])
+            n = len(df)
+            # At most one vote per indicator, so the counters fit in int8
+            counts = np.zeros((n, 3), dtype=np.int8)
+            confidence_sums = np.zeros((n, 3))
+            rows = np.arange(n)
+            
+            def vote(codes, confidences):
+                np.add.at(counts, (rows, codes), 1)
+                np.add.at(confidence_sums, (rows, codes), confidences)
+            
+            # RSI Analysis (NaN falls through to HOLD, as in the scalar version)
+            rsi = df['rsi'].to_numpy()
+            rsi_code = np.where(rsi < 30, 0, np.where(rsi > 70, 1, 2))
+            vote(rsi_code, np.where(rsi_code == 2, 0.5, 0.8))
+            
+            # MACD Analysis
+            macd_code = np.where(df['macd'].to_numpy() > df['macd_signal'].to_numpy(), 0, 1)
+            vote(macd_code, np.full(n, 0.7))
+            
+            # Bollinger Bands Analysis
+            bb_position = df['bb_position'].to_numpy()
+            bb_code = np.where(bb_position < 0.2, 0, np.where(bb_position > 0.8, 1, 2))
+            vote(bb_code, np.where(bb_code == 2, 0.5, 0.6))
+            
+            # Moving Averages Analysis: majority vote, only where any SMA voted
+            current_price = df['close'].to_numpy()
+            sma_buy = np.zeros(n, dtype=np.int8)
+            sma_sell = np.zeros(n, dtype=np.int8)
+            for period in self.config.SMA_PERIODS:
+                sma_value = df[f'sma_{period}'].to_numpy()
+                valid = (sma_value != 0) & (current_price != 0)
+                sma_buy += valid & (current_price > sma_value)
+                sma_sell += valid & (current_price < sma_value)
+            sma_code = np.where(sma_buy > sma_sell, 0, np.where(sma_sell > sma_buy, 1, 2))
+            sma_voted = (sma_buy + sma_sell) > 0
+            vote_rows = rows[sma_voted]
+            np.add.at(counts, (vote_rows, sma_code[sma_voted]), 1)
+            np.add.at(confidence_sums, (vote_rows, sma_code[sma_voted]),
+                      np.where(sma_code[sma_voted] == 2, 0.5, 0.6))
+            
+            # Dominant signal; ties resolve BUY, SELL, HOLD like max() over the dict
+            dominant = counts.argmax(axis=1)
+            dominant_count = counts[rows, dominant]
+            avg_confidence = confidence_sums[rows, dominant] / dominant_count
+            
+            return [
+                {
+                    'signal': signal,
+                    'confidence': confidence,
+                    'reason': f'Technical analysis: {signal} signal from {count} indicators'
+                }
+                for signal, confidence, count in zip(
+                    signal_names[dominant].tolist(), avg_confidence.tolist(), dominant_count.tolist()
+                )
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error analyzing technical indicator history: {e}")
+            return None
+    
+    def analyze_trend_confirmation_history(self, df):
+        """Vectorized analyze_trend_confirmation for every prefix of a price frame"""
+        try:
+            close = df['close'].to_numpy()
+            n = len(close)
+            
+            # Price change over the last 6 bars (fewer at the start of the history)
+            first_price = close[np.maximum(np.arange(n) - 5, 0)]
+            price_change = (close - first_price) / first_price
+            trend_confidence = np.minimum(0.8, 0.5 + np.abs(price_change) * 10)
+            
+            results = []
+            for i, (change, confidence) in enumerate(zip(price_change.tolist(), trend_confidence.tolist())):
+                if i < 2:
+                    results.append({'signal': 'HOLD', 'confidence': 0.5, 'reason': 'Insufficient price data'})
+                    continue
+                if change > 0.02:
+                    signal = 'BUY'
+                elif change < -0.02:
+                    signal = 'SELL'
+                else:
+                    signal = 'HOLD'
+                    confidence = 0.5
+                results.append({
+                    'signal': signal,
+                    'confidence': confidence,
+                    'reason': f'Trend analysis: {change:.2%} price change over 6 hours'
+                })
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error analyzing trend history: {e}")
+            return None
+    
     def analyze_liquidity_volatility(self, market_data):
         """Analyze liquidity and volatility"""
         try:
@@ -316,34 +415,38 @@ class LogicEngine:
             if df.empty:
                 return 'UNKNOWN'
             
-            # Calculate volatility
-            returns = df['close'].pct_change().dropna()
+            # Calculate volatility (price_trend is the precomputed close-to-close return)
+            returns = df['price_trend'] if 'price_trend' in df else df['close'].pct_change()
             volatility = returns.std()
             
+            # Plain array view for the scalar reads below
+            close = df['close'].to_numpy()
+            
             # Calculate trend strength using ADX
             adx = df.get('adx', None)
             if adx is not None and not adx.isna().all():
-                trend_strength = adx.iloc[-1]
+                trend_strength = adx.iat[-1]
             else:
-                # Simple trend calculation
-                sma_20 = df['close'].rolling(20).mean()
-                sma_50 = df['close'].rolling(50).mean()
-                trend_strength = abs(sma_20.iloc[-1] - sma_50.iloc[-1]) / sma_50.iloc[-1] * 100
+                # Simple trend calculation, reusing the indicator SMAs when present
+                sma_20 = df['sma_20'] if 'sma_20' in df else df['close'].rolling(20).mean()
+                sma_50 = df['sma_50'] if 'sma_50' in df else df['close'].rolling(50).mean()
+                sma_50_last = sma_50.iat[-1]
+                trend_strength = abs(sma_20.iat[-1] - sma_50_last) / sma_50_last * 100
             
             # Determine regime
             if volatility > 0.03:  # High volatility
                 if trend_strength > 25:
-                    return 'BULLISH_HIGH' if df['close'].iloc[-1] > df['close'].iloc[-20] else 'BEARISH_HIGH'
+                    return 'BULLISH_HIGH' if close[-1] > close[-20] else 'BEARISH_HIGH'
                 else:
                     return 'SIDEWAYS_HIGH'
             elif volatility > 0.015:  # Medium volatility
                 if trend_strength > 25:
-                    return 'BULLISH_MEDIUM' if df['close'].iloc[-1] > df['close'].iloc[-20] else 'BEARISH_MEDIUM'
+                    return 'BULLISH_MEDIUM' if close[-1] > close[-20] else 'BEARISH_MEDIUM'
                 else:
                     return 'SIDEWAYS_MEDIUM'
             else:  # Low volatility
                 if trend_strength > 25:
-                    return 'BULLISH_LOW' if df['close'].iloc[-1] > df['close'].iloc[-20] else 'BEARISH_LOW'
+                    return 'BULLISH_LOW' if close[-1] > close[-20] else 'BEARISH_LOW'
                 else:
                     return 'SIDEWAYS_LOW'
                     
@@ -11,6 +11,7 @@ import time
 import threading
 from datetime import datetime
 import signal
+import numpy as np
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -23,6 +24,7 @@ from logic_engine import LogicEngine
 from executor import Executor
 from trade_logger import TradeLogger
 from terminal_interface import TerminalInterface
+from backtest_kernels import DECISION_BUY, DECISION_HOLD, DECISION_SELL, simulate_long_positions
 
 class TradingSystem:
     """Main trading system that orchestrates all modules"""
@@ -40,7 +42,7 @@ class TradingSystem:
             self.ml_predictor = MLPredictor()
             self.risk_module = RiskModule()
             self.logic_engine = LogicEngine()
-            self.executor = Executor()
+            self.executor = Executor(client=self.data_retriever.client)
             self.trade_logger = TradeLogger()
             
             # Initialize terminal interface
@@ -81,7 +83,7 @@ class TradingSystem:
                 return False
             
             # 2. Get technical indicators
-            indicators = self.data_retriever.get_latest_indicators()
+            indicators = self.data_retriever.get_latest_indicators(market_data)
             
             # 3. Get ML prediction
             ml_prediction = self.ml_predictor.predict(market_data['dataframe'])
@@ -168,15 +170,15 @@ class TradingSystem:
         self.logger.info(f"Starting backtest from {start_date} to {end_date}")
         
         try:
-            # Get historical data
-            historical_data = self.data_retriever.get_historical_data(start_date, end_date)
+            # Get historical data with indicators (cached on disk across runs)
+            indicator_data = self.data_retriever.get_historical_indicators(start_date, end_date)
             
-            if historical_data.empty:
+            if indicator_data is None or indicator_data.empty:
                 self.logger.error("No historical data available for backtest")
                 return
             
             # Run backtest
-            results = self._run_backtest(historical_data)
+            results = self._run_backtest(indicator_data)
             
             # Display results
             self._display_backtest_results(results)
@@ -184,8 +186,8 @@ class TradingSystem:
         except Exception as e:
             self.logger.error(f"Error in backtest mode: {e}")
     
-    def _run_backtest(self, historical_data):
-        """Run backtest on historical data"""
+    def _run_backtest(self, indicator_data):
+        """Run backtest on historical data with precomputed indicators"""
         results = {
             'trades': [],
             'initial_balance': 10000,  # $10,000 starting balance
@@ -195,95 +197,65 @@ class TradingSystem:
             'losing_trades': 0
         }
         
-        position = None
+        # Technical and trend signals for every bar in one vectorized pass
+        technical_analyses = self.logic_engine.analyze_technical_indicators_history(indicator_data)
+        trend_analyses = self.logic_engine.analyze_trend_confirmation_history(indicator_data)
+        if technical_analyses is None or trend_analyses is None:
+            self.logger.error("Failed to precompute backtest signals")
+            return results
         
-        for i in range(len(historical_data) - 1):
+        # ML predictions for every bar in one batched model call
+        ml_predictions = self.ml_predictor.predict_batch(indicator_data)
+        if ml_predictions is None:
+            ml_predictions = [None] * len(indicator_data)
+        
+        # No 24h stats exist for historical bars, so this is the same for every bar
+        liquidity_analysis = self.logic_engine.analyze_liquidity_volatility({'dataframe': indicator_data})
+        
+        # Decide on every bar, then simulate the position in one compiled pass
+        decision_codes = {'BUY': DECISION_BUY, 'SELL': DECISION_SELL}
+        decisions = np.zeros(len(indicator_data), dtype=np.int8)
+        
+        for i in range(len(indicator_data) - 1):
             try:
-                # Get data up to current point
-                current_data = historical_data.iloc[:i+1]
-                current_price = current_data.iloc[-1]['close']
-                
-                # Get indicators for current data
-                indicators = self.data_retriever.calculate_indicators(current_data)
-                if not indicators:
-                    continue
-                
-                # Get ML prediction
-                ml_prediction = self.ml_predictor.predict(current_data)
-                
-                # Analyze market conditions
-                technical_analysis = self.logic_engine.analyze_technical_indicators(indicators.iloc[-1])
-                trend_analysis = self.logic_engine.analyze_trend_confirmation({'dataframe': current_data})
-                liquidity_analysis = self.logic_engine.analyze_liquidity_volatility({'dataframe': current_data})
-                
                 # Make decision
                 decision = self.logic_engine.make_decision(
-                    technical_analysis, ml_prediction, trend_analysis, liquidity_analysis
+                    technical_analyses[i], ml_predictions[i], trend_analyses[i], liquidity_analysis
                 )
-                
-                # Execute trades based on decision
-                if decision and decision['decision'] != 'HOLD':
-                    if decision['decision'] == 'BUY' and position is None:
-                        # Open long position
-                        position = {
-                            'type': 'LONG',
-                            'entry_price': current_price,
-                            'entry_time': current_data.index[-1],
-                            'quantity': results['current_balance'] * 0.95 / current_price  # Use 95% of balance
-                        }
-                        results['total_trades'] += 1
-                        
-                    elif decision['decision'] == 'SELL' and position is not None:
-                        # Close position
-                        exit_price = current_price
-                        pnl = (exit_price - position['entry_price']) * position['quantity']
-                        results['current_balance'] += pnl
-                        
-                        trade_result = {
-                            'entry_time': position['entry_time'],
-                            'exit_time': current_data.index[-1],
-                            'entry_price': position['entry_price'],
-                            'exit_price': exit_price,
-                            'quantity': position['quantity'],
-                            'pnl': pnl,
-                            'return_pct': (pnl / (position['entry_price'] * position['quantity'])) * 100
-                        }
-                        
-                        results['trades'].append(trade_result)
-                        
-                        if pnl > 0:
-                            results['winning_trades'] += 1
-                        else:
-                            results['losing_trades'] += 1
-                        
-                        position = None
+                if decision:
+                    decisions[i] = decision_codes.get(decision['decision'], DECISION_HOLD)
                 
             except Exception as e:
                 self.logger.error(f"Error in backtest iteration {i}: {e}")
                 continue
         
-        # Close any open position at the end
-        if position is not None:
-            final_price = historical_data.iloc[-1]['close']
-            pnl = (final_price - position['entry_price']) * position['quantity']
-            results['current_balance'] += pnl
-            
-            trade_result = {
-                'entry_time': position['entry_time'],
-                'exit_time': historical_data.index[-1],
-                'entry_price': position['entry_price'],
-                'exit_price': final_price,
-                'quantity': position['quantity'],
-                'pnl': pnl,
-                'return_pct': (pnl / (position['entry_price'] * position['quantity'])) * 100
+        close_prices = indicator_data['close'].to_numpy(dtype=np.float64)
+        entry_index, exit_index, quantity, pnl, final_balance, positions_opened = simulate_long_positions(
+            close_prices, decisions, float(results['initial_balance']), 0.95  # Use 95% of balance
+        )
+        
+        timestamps = indicator_data.index
+        entry_price = close_prices[entry_index]
+        return_pct = pnl / (entry_price * quantity) * 100
+        results['trades'] = [
+            {
+                'entry_time': timestamps[entry],
+                'exit_time': timestamps[exit_],
+                'entry_price': price_in,
+                'exit_price': price_out,
+                'quantity': qty,
+                'pnl': trade_pnl,
+                'return_pct': trade_return
             }
-            
-            results['trades'].append(trade_result)
-            
-            if pnl > 0:
-                results['winning_trades'] += 1
-            else:
-                results['losing_trades'] += 1
+            for entry, exit_, price_in, price_out, qty, trade_pnl, trade_return in zip(
+                entry_index.tolist(), exit_index.tolist(), entry_price.tolist(),
+                close_prices[exit_index].tolist(), quantity.tolist(), pnl.tolist(), return_pct.tolist()
+            )
+        ]
+        results['current_balance'] = final_balance
+        results['total_trades'] = positions_opened
+        results['winning_trades'] = int((pnl > 0).sum())
+        results['losing_trades'] = len(pnl) - results['winning_trades']
         
         return results
     
@@ -6,11 +6,8 @@ Output: Signal → BUY, SELL, HOLD
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
-from tensorflow.keras.optimizers import Adam
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.metrics import accuracy_score
 import logging
@@ -20,6 +17,9 @@ from datetime import datetime, timedelta
 from config import Config
 
 class MLPredictor:
+    # Model input columns, in order
+    FEATURES = ['close', 'volume', 'rsi', 'macd', 'bb_position']
+    
     def __init__(self):
         """Initialize ML Predictor"""
         self.config = Config()
@@ -34,6 +34,7 @@ class MLPredictor:
         self.model = None
         self.scaler = MinMaxScaler()
         self.is_trained = False
+        self._last_prediction = None  # (input key, result) of the most recent predict
         
         # Ensemble models
         self.models = {}
@@ -57,18 +58,20 @@ class MLPredictor:
                 return None, None
             
             # Select features for prediction
-            features = ['close', 'volume', 'rsi', 'macd', 'bb_position']
-            available_features = [f for f in features if f in df.columns]
+            available_features = [f for f in self.FEATURES if f in df.columns]
             
             if len(available_features) < 2:
                 self.logger.warning("Insufficient features for ML prediction")
                 return None, None
             
-            # Create feature matrix
-            data = df[available_features].values
+            # Create feature matrix in float32, the precision the LSTM trains in,
+            # so the scaler and the (samples, lookback, features) tensor are half size
+            data = df[available_features].to_numpy(dtype=np.float32)
             
-            # Remove any NaN values
-            data = data[~np.isnan(data).any(axis=1)]
+            # Remove any NaN values (the boolean-index copy is skipped when there are none)
+            valid_rows = ~np.isnan(data).any(axis=1)
+            if not valid_rows.all():
+                data = data[valid_rows]
             
             if len(data) < self.lookback_hours + 1:
                 self.logger.warning("Insufficient data for prediction")
@@ -77,18 +80,14 @@ class MLPredictor:
             # Scale the data
             scaled_data = self.scaler.fit_transform(data)
             
-            # Create sequences for LSTM
-            X, y = [], []
-            for i in range(self.lookback_hours, len(scaled_data)):
-                X.append(scaled_data[i-self.lookback_hours:i])
-                # Target: 1 if price goes up, 0 if down
-                if i < len(scaled_data) - 1:
-                    future_price = scaled_data[i+1, 0]  # close price
-                    current_price = scaled_data[i, 0]
-                    y.append(1 if future_price > current_price else 0)
+            # Create sequences for LSTM: every window of lookback_hours rows
+            # ending just before bar i, for i in [lookback_hours, len)
+            windows = sliding_window_view(scaled_data, self.lookback_hours, axis=0)
+            X = np.ascontiguousarray(windows[:-1].transpose(0, 2, 1))
             
-            X = np.array(X)
-            y = np.array(y)
+            # Target: 1 if the next close is above the current close, 0 if not
+            closes = scaled_data[:, 0]
+            y = (closes[self.lookback_hours + 1:] > closes[self.lookback_hours:-1]).astype(int)
             
             return X, y
             
@@ -99,6 +98,11 @@ class MLPredictor:
     def build_model(self, input_shape):
         """Build LSTM model architecture"""
         try:
+            # TensorFlow takes seconds to import; only pay for it when a model is needed
+            from tensorflow.keras.models import Sequential
+            from tensorflow.keras.layers import LSTM, Dense, Dropout
+            from tensorflow.keras.optimizers import Adam
+            
             model = Sequential([
                 LSTM(50, return_sequences=True, input_shape=input_shape),
                 Dropout(0.2),
@@ -131,6 +135,9 @@ class MLPredictor:
                 self.logger.error("Failed to prepare data for training")
                 return False
             
+            # The newest sequence has no next bar to label it
+            X = X[:len(y)]
+            
             # Split data
             split_idx = int(len(X) * 0.8)
             X_train, X_test = X[:split_idx], X[split_idx:]
@@ -160,6 +167,7 @@ class MLPredictor:
             # Save model
             self.save_model()
             self.is_trained = True
+            self._last_prediction = None
             
             return True
             
@@ -175,6 +183,12 @@ class MLPredictor:
                 if not self.train_model(df):
                     return None
             
+            # Callers within one cycle often predict on the same frame; only the
+            # latest bar can change between polls, so it identifies the input
+            key = (len(df), df.index[0], df.index[-1], df.iloc[-1].to_numpy(dtype=np.float64).tobytes())
+            if self._last_prediction is not None and self._last_prediction[0] == key:
+                return dict(self._last_prediction[1], timestamp=datetime.now())
+            
             # Prepare data for prediction
             X, _ = self.prepare_data(df)
             if X is None or len(X) == 0:
@@ -187,31 +201,91 @@ class MLPredictor:
             prediction = self.model.predict(latest_sequence, verbose=0)
             confidence = prediction[0][0]
             
-            # Determine signal
-            if confidence > 0.5 + (1 - self.confidence_threshold) / 2:
-                signal = 'BUY'
-                signal_strength = confidence
-            elif confidence < 0.5 - (1 - self.confidence_threshold) / 2:
-                signal = 'SELL'
-                signal_strength = 1 - confidence
-            else:
-                signal = 'HOLD'
-                signal_strength = 0.5
-            
-            result = {
-                'signal': signal,
-                'confidence': confidence,
-                'signal_strength': signal_strength,
-                'timestamp': datetime.now()
-            }
+            result = self._prediction_result(confidence, datetime.now())
             
-            self.logger.info(f"Prediction: {signal} (confidence: {confidence:.4f})")
+            self._last_prediction = (key, result)
+            self.logger.info(f"Prediction: {result['signal']} (confidence: {confidence:.4f})")
             return result
             
         except Exception as e:
             self.logger.error(f"Error making prediction: {e}")
             return None
     
+    def _prediction_result(self, confidence, timestamp):
+        """Turn a model confidence into a BUY/SELL/HOLD prediction"""
+        if confidence > 0.5 + (1 - self.confidence_threshold) / 2:
+            signal = 'BUY'
+            signal_strength = confidence
+        elif confidence < 0.5 - (1 - self.confidence_threshold) / 2:
+            signal = 'SELL'
+            signal_strength = 1 - confidence
+        else:
+            signal = 'HOLD'
+            signal_strength = 0.5
+        
+        return {
+            'signal': signal,
+            'confidence': confidence,
+            'signal_strength': signal_strength,
+            'timestamp': timestamp
+        }
+    
+    def predict_batch(self, df):
+        """Predict for every row of a history as predict would on each prefix, in one model call
+        
+        Returns a list aligned with df rows holding a prediction dict, or None where
+        predict would not have produced one.
+        """
+        try:
+            predictions = [None] * len(df)
+            available_features = [f for f in self.FEATURES if f in df.columns]
+            if len(available_features) < 2:
+                self.logger.warning("Insufficient features for ML prediction")
+                return predictions
+            
+            # Rows without NaNs, and how many of them each prefix contains
+            data = df[available_features].to_numpy(dtype=np.float32)
+            valid_rows = ~np.isnan(data).any(axis=1)
+            data = data[valid_rows]
+            valid_counts = np.cumsum(valid_rows)
+            
+            # predict needs lookback_hours + 1 valid rows in its prefix
+            ready = np.flatnonzero(valid_counts >= self.lookback_hours + 1)
+            if len(ready) == 0:
+                return predictions
+            
+            # Train on the shortest prefix that trains, as per-bar predict calls would
+            if not self.is_trained or self.model is None:
+                self.logger.warning("Model not trained. Training now...")
+                while len(ready) > 0 and not self.train_model(df.iloc[:ready[0] + 1]):
+                    ready = ready[1:]
+                if len(ready) == 0:
+                    return predictions
+            
+            # predict rescales each prefix to its own min/max: use expanding extremes
+            data_min = np.minimum.accumulate(data, axis=0)
+            data_range = np.maximum.accumulate(data, axis=0) - data_min
+            data_range[data_range == 0] = 1  # MinMaxScaler leaves constant features unscaled
+            
+            # The latest sequence of a prefix with m valid rows is valid rows [m-1-L, m-1)
+            counts = valid_counts[ready]
+            windows = sliding_window_view(data, self.lookback_hours, axis=0).transpose(0, 2, 1)
+            scale_rows = counts - 1
+            X = (windows[counts - 1 - self.lookback_hours] - data_min[scale_rows, None, :]) / data_range[scale_rows, None, :]
+            
+            confidences = self.model.predict(X.astype(np.float32), verbose=0)[:, 0]
+            
+            timestamp = datetime.now()
+            for row, confidence in zip(ready.tolist(), confidences):
+                predictions[row] = self._prediction_result(confidence, timestamp)
+            
+            self.logger.info(f"Batch prediction completed for {len(ready)} bars")
+            return predictions
+            
+        except Exception as e:
+            self.logger.error(f"Error making batch prediction: {e}")
+            return None
+    
     def retrain_model(self, df):
         """Retrain model with new data"""
         try:
@@ -241,6 +315,7 @@ class MLPredictor:
             scaler_path = 'models/scaler.pkl'
             
             if os.path.exists(model_path) and os.path.exists(scaler_path):
+                import tensorflow as tf
                 self.model = tf.keras.models.load_model(model_path)
                 self.scaler = joblib.load(scaler_path)
                 self.is_trained = True
@@ -18,6 +18,7 @@ class RiskModule:
         self.take_profit_percentage = self.config.TAKE_PROFIT_PERCENTAGE
         self.max_daily_trades = self.config.MAX_DAILY_TRADES
         self.max_daily_loss = self.config.MAX_DAILY_LOSS
+        self.min_signal_strength = self.config.MIN_SIGNAL_STRENGTH
         
         # Trading state
         self.daily_trades = 0
@@ -98,6 +99,11 @@ class RiskModule:
     def can_trade(self, signal_strength):
         """Check if trading is allowed based on risk parameters"""
         try:
+            # Check signal strength first; it needs no clock or counter state
+            if signal_strength < self.min_signal_strength:
+                self.logger.info("Signal strength too low for trading")
+                return False, "Signal strength too low"
+            
             self.reset_daily_counters()
             
             # Check daily trade limit
@@ -110,11 +116,6 @@ class RiskModule:
                 self.logger.warning("Daily loss limit reached")
                 return False, "Daily loss limit reached"
             
-            # Check signal strength
-            if signal_strength < 0.6:
-                self.logger.info("Signal strength too low for trading")
-                return False, "Signal strength too low"
-            
             return True, "Trading allowed"
             
         except Exception as e:
@@ -178,6 +179,10 @@ class RiskModule:
     def check_stop_loss_take_profit(self, current_price):
         """Check if any positions hit stop loss or take profit"""
         try:
+            # Nothing to check while flat, which is most ticks
+            if not self.active_positions:
+                return []
+            
             positions_to_close = []
             
             for order_id, position in self.active_positions.items():
@@ -22,6 +22,7 @@ class TerminalInterface:
         self.logger = logging.getLogger(__name__)
         self.monitoring = False
         self.monitor_thread = None
+        self.monitor_stop = threading.Event()  # Wakes the monitor loop out of its refresh wait
         
         self.logger.info("Terminal Interface initialized")
     
@@ -104,6 +105,7 @@ class TerminalInterface:
         
         # Start monitoring in a separate thread
         self.monitoring = True
+        self.monitor_stop.clear()
         self.monitor_thread = threading.Thread(target=self.monitor_loop)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
@@ -122,7 +124,7 @@ class TerminalInterface:
                 self.clear_screen()
                 self.print_header()
                 self.show_monitoring_dashboard()
-                time.sleep(5)  # Update every 5 seconds
+                self.monitor_stop.wait(5)  # Update every 5 seconds, or stop right away
         except Exception as e:
             self.logger.error(f"Error in monitoring loop: {e}")
             self.monitoring = False
@@ -140,7 +142,7 @@ class TerminalInterface:
             stats_24h = market_data.get('stats_24h', {})
             
             # Get latest indicators
-            indicators = self.trading_system.data_retriever.get_latest_indicators()
+            indicators = self.trading_system.data_retriever.get_latest_indicators(market_data)
             
             # Get ML prediction
             ml_prediction = self.trading_system.ml_predictor.predict(market_data['dataframe'])
@@ -225,6 +227,7 @@ class TerminalInterface:
     def stop_monitoring(self):
         """Stop monitoring"""
         self.monitoring = False
+        self.monitor_stop.set()
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=1)
         self.print_info("Monitoring stopped")
@@ -244,7 +247,7 @@ class TerminalInterface:
                 return
             
             # Get technical indicators
-            indicators = self.trading_system.data_retriever.get_latest_indicators()
+            indicators = self.trading_system.data_retriever.get_latest_indicators(market_data)
             
             # Get ML prediction
             ml_prediction = self.trading_system.ml_predictor.predict(market_data['dataframe'])
@@ -4,11 +4,106 @@ Test Binance Testnet Connection
 Verifies that the testnet configuration works properly
 """
 
+import hmac
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
 from datetime import datetime
 from config import Config
 
+# (connect, read) timeouts: an unreachable host fails in seconds, while a
+# slow but connected response still gets the full read budget
+REQUEST_TIMEOUT = (3, 10)
+
+# One pooled session so every probe reuses the same keep-alive TLS connection
+SESSION = requests.Session()
+# Retry throttled (429) and failed (5xx) GETs with jittered backoff but retry a
+# refused connection only once; the last response is still returned so the
+# probe reports its status code
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=Config.HTTP_MAX_RETRIES,
+    connect=1,
+    backoff_factor=Config.HTTP_BACKOFF_FACTOR,
+    backoff_jitter=Config.HTTP_BACKOFF_JITTER,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)))
+
+def sign_params(params, secret_key):
+    """Add timestamp and HMAC-SHA256 signature to signed endpoint parameters"""
+    params = dict(params, timestamp=int(time.time() * 1000))
+    query = urlencode(params)
+    # One-shot hmac.digest skips building a Python-level HMAC object per request
+    params['signature'] = hmac.digest(secret_key.encode('utf-8'), query.encode('utf-8'), 'sha256').hex()
+    return params
+
+def get_public(path, params=None):
+    """GET a public REST endpoint"""
+    return SESSION.get(f"{Config.BINANCE_BASE_URL}{path}", params=params, timeout=REQUEST_TIMEOUT)
+
+def report_ping(payload):
+    """Report basic connectivity"""
+    print("✅ Basic connectivity: SUCCESS")
+
+def report_server_time(payload):
+    """Report server time"""
+    print(f"✅ Server time: {datetime.fromtimestamp(payload['serverTime']/1000)}")
+
+def report_exchange_info(payload):
+    """Report whether the trading symbol is listed"""
+    symbols = [s['symbol'] for s in payload['symbols'] if s['symbol'] == Config.SYMBOL]
+    if symbols:
+        print(f"✅ Exchange info: SUCCESS (Found {Config.SYMBOL})")
+    else:
+        print(f"⚠️ Exchange info: SUCCESS (But {Config.SYMBOL} not found)")
+
+def report_ticker(payload):
+    """Report 24hr ticker statistics"""
+    print(f"✅ 24hr ticker: SUCCESS")
+    print(f"   Current Price: ${float(payload['lastPrice']):,.2f}")
+    print(f"   24hr Change: {float(payload['priceChangePercent']):+.2f}%")
+    print(f"   24hr Volume: {float(payload['volume']):,.2f}")
+
+def report_klines(payload):
+    """Report the latest historical candle"""
+    print(f"✅ Historical data: SUCCESS ({len(payload)} candles)")
+    if payload:
+        latest_candle = payload[-1]
+        print(f"   Latest candle: {datetime.fromtimestamp(latest_candle[0]/1000)}")
+        print(f"   Open: ${float(latest_candle[1]):,.2f}")
+        print(f"   High: ${float(latest_candle[2]):,.2f}")
+        print(f"   Low: ${float(latest_candle[3]):,.2f}")
+        print(f"   Close: ${float(latest_candle[4]):,.2f}")
+
+# Public probes: (heading, label, path, params, report). exchangeInfo is
+# filtered to the trading symbol; the unfiltered response lists every market
+PUBLIC_PROBES = [
+    ("🔗 Testing basic connectivity...", "Basic connectivity",
+     '/api/v3/ping', None, report_ping),
+    ("⏰ Testing server time...", "Server time",
+     '/api/v3/time', None, report_server_time),
+    ("📈 Testing exchange info...", "Exchange info",
+     '/api/v3/exchangeInfo', {'symbol': Config.SYMBOL}, report_exchange_info),
+    (f"💰 Testing 24hr ticker for {Config.SYMBOL}...", "24hr ticker",
+     '/api/v3/ticker/24hr', {'symbol': Config.SYMBOL}, report_ticker),
+    (f"📊 Testing historical data for {Config.SYMBOL}...", "Historical data",
+     '/api/v3/klines', {'symbol': Config.SYMBOL, 'interval': '1h', 'limit': 10}, report_klines)
+]
+
+def get_account():
+    """GET the signed account endpoint"""
+    return SESSION.get(
+        f"{Config.BINANCE_BASE_URL}/api/v3/account",
+        params=sign_params({'recvWindow': 5000}, Config.BINANCE_SECRET_KEY),
+        headers={'X-MBX-APIKEY': Config.BINANCE_API_KEY},
+        timeout=REQUEST_TIMEOUT
+    )
+
 def test_binance_testnet():
     """Test Binance testnet connectivity and basic functionality"""
     
@@ -20,95 +115,36 @@ def test_binance_testnet():
     print(f"🌐 Base URL: {Config.BINANCE_BASE_URL}")
     print(f"🔌 WebSocket URL: {Config.BINANCE_WS_URL}")
     
-    # Test 2: Test basic connectivity
-    try:
-        print("\n🔗 Testing basic connectivity...")
-        response = requests.get(f"{Config.BINANCE_BASE_URL}/api/v3/ping", timeout=10)
-        if response.status_code == 200:
-            print("✅ Basic connectivity: SUCCESS")
-        else:
-            print(f"❌ Basic connectivity: FAILED (Status: {response.status_code})")
-    except Exception as e:
-        print(f"❌ Basic connectivity: ERROR - {e}")
+    # Tests 2-7: the probes are independent, so issue them all at once
+    # and report the results in order as each one is needed
+    has_credentials = bool(Config.BINANCE_API_KEY and Config.BINANCE_SECRET_KEY)
+    executor = ThreadPoolExecutor(max_workers=len(PUBLIC_PROBES) + 1)
+    futures = [executor.submit(get_public, path, params) for _, _, path, params, _ in PUBLIC_PROBES]
+    account_future = executor.submit(get_account) if has_credentials else None
+    executor.shutdown(wait=False)
     
-    # Test 3: Test server time
-    try:
-        print("\n⏰ Testing server time...")
-        response = requests.get(f"{Config.BINANCE_BASE_URL}/api/v3/time", timeout=10)
-        if response.status_code == 200:
-            server_time = response.json()
-            print(f"✅ Server time: {datetime.fromtimestamp(server_time['serverTime']/1000)}")
-        else:
-            print(f"❌ Server time: FAILED (Status: {response.status_code})")
-    except Exception as e:
-        print(f"❌ Server time: ERROR - {e}")
-    
-    # Test 4: Test exchange info
-    try:
-        print("\n📈 Testing exchange info...")
-        response = requests.get(f"{Config.BINANCE_BASE_URL}/api/v3/exchangeInfo", timeout=10)
-        if response.status_code == 200:
-            exchange_info = response.json()
-            symbols = [s['symbol'] for s in exchange_info['symbols'] if s['symbol'] == Config.SYMBOL]
-            if symbols:
-                print(f"✅ Exchange info: SUCCESS (Found {Config.SYMBOL})")
+    for (heading, label, _, _, report), future in zip(PUBLIC_PROBES, futures):
+        try:
+            print(f"\n{heading}")
+            response = future.result()
+            if response.status_code == 200:
+                report(response.json())
             else:
-                print(f"⚠️ Exchange info: SUCCESS (But {Config.SYMBOL} not found)")
-        else:
-            print(f"❌ Exchange info: FAILED (Status: {response.status_code})")
-    except Exception as e:
-        print(f"❌ Exchange info: ERROR - {e}")
-    
-    # Test 5: Test 24hr ticker
-    try:
-        print(f"\n💰 Testing 24hr ticker for {Config.SYMBOL}...")
-        response = requests.get(f"{Config.BINANCE_BASE_URL}/api/v3/ticker/24hr", 
-                              params={'symbol': Config.SYMBOL}, timeout=10)
-        if response.status_code == 200:
-            ticker = response.json()
-            print(f"✅ 24hr ticker: SUCCESS")
-            print(f"   Current Price: ${float(ticker['lastPrice']):,.2f}")
-            print(f"   24hr Change: {float(ticker['priceChangePercent']):+.2f}%")
-            print(f"   24hr Volume: {float(ticker['volume']):,.2f}")
-        else:
-            print(f"❌ 24hr ticker: FAILED (Status: {response.status_code})")
-    except Exception as e:
-        print(f"❌ 24hr ticker: ERROR - {e}")
-    
-    # Test 6: Test historical klines (candlestick data)
-    try:
-        print(f"\n📊 Testing historical data for {Config.SYMBOL}...")
-        params = {
-            'symbol': Config.SYMBOL,
-            'interval': '1h',
-            'limit': 10
-        }
-        response = requests.get(f"{Config.BINANCE_BASE_URL}/api/v3/klines", 
-                              params=params, timeout=10)
-        if response.status_code == 200:
-            klines = response.json()
-            print(f"✅ Historical data: SUCCESS ({len(klines)} candles)")
-            if klines:
-                latest_candle = klines[-1]
-                print(f"   Latest candle: {datetime.fromtimestamp(latest_candle[0]/1000)}")
-                print(f"   Open: ${float(latest_candle[1]):,.2f}")
-                print(f"   High: ${float(latest_candle[2]):,.2f}")
-                print(f"   Low: ${float(latest_candle[3]):,.2f}")
-                print(f"   Close: ${float(latest_candle[4]):,.2f}")
-        else:
-            print(f"❌ Historical data: FAILED (Status: {response.status_code})")
-    except Exception as e:
-        print(f"❌ Historical data: ERROR - {e}")
+                print(f"❌ {label}: FAILED (Status: {response.status_code})")
+        except Exception as e:
+            print(f"❌ {label}: ERROR - {e}")
     
     # Test 7: Test API key authentication (if provided)
-    if Config.BINANCE_API_KEY and Config.BINANCE_SECRET_KEY:
+    if has_credentials:
         try:
             print(f"\n🔐 Testing API authentication...")
-            # This would require HMAC signature generation
-            # For now, just check if credentials are set
-            print(f"✅ API Key: {'✅ SET' if Config.BINANCE_API_KEY else '❌ NOT SET'}")
-            print(f"✅ Secret Key: {'✅ SET' if Config.BINANCE_SECRET_KEY else '❌ NOT SET'}")
-            print("ℹ️  Note: Full authentication test requires HMAC signature generation")
+            response = account_future.result()
+            if response.status_code == 200:
+                account = response.json()
+                funded = [b for b in account.get('balances', []) if float(b['free']) + float(b['locked']) > 0]
+                print(f"✅ API authentication: SUCCESS ({len(funded)} funded assets)")
+            else:
+                print(f"❌ API authentication: FAILED (Status: {response.status_code}, {response.text})")
         except Exception as e:
             print(f"❌ API authentication: ERROR - {e}")
     else:
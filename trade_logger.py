@@ -5,6 +5,7 @@ Stores every trade, PnL, and metrics for performance review
 
 import sqlite3
 import pandas as pd
+import numpy as np
 import logging
 from datetime import datetime, timedelta
 import json
@@ -256,35 +257,43 @@ class TradeLogger:
             if closed_trades.empty:
                 return {}
             
-            # Calculate basic metrics
-            total_trades = len(closed_trades)
-            winning_trades = len(closed_trades[closed_trades['pnl'] > 0])
-            losing_trades = len(closed_trades[closed_trades['pnl'] < 0])
+            # Calculate basic metrics from one PnL array
+            pnl = closed_trades['pnl'].to_numpy(dtype=np.float64)
+            wins = pnl[pnl > 0]
+            losses = pnl[pnl < 0]
             
-            total_pnl = closed_trades['pnl'].sum()
+            total_trades = len(pnl)
+            winning_trades = len(wins)
+            losing_trades = len(losses)
+            
+            total_pnl = np.nansum(pnl)
             win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
             
-            avg_win = closed_trades[closed_trades['pnl'] > 0]['pnl'].mean() if winning_trades > 0 else 0
-            avg_loss = closed_trades[closed_trades['pnl'] < 0]['pnl'].mean() if losing_trades > 0 else 0
+            avg_win = wins.mean() if winning_trades > 0 else 0
+            avg_loss = losses.mean() if losing_trades > 0 else 0
             
             # Calculate max drawdown
-            cumulative_pnl = closed_trades['pnl'].cumsum()
-            running_max = cumulative_pnl.expanding().max()
-            drawdown = (cumulative_pnl - running_max) / running_max * 100
-            max_drawdown = abs(drawdown.min())
+            cumulative_pnl = np.nancumsum(pnl)
+            running_max = np.maximum.accumulate(cumulative_pnl)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drawdown = (cumulative_pnl - running_max) / running_max * 100
+            max_drawdown = abs(np.nanmin(drawdown))
+            
+            # Per-trade returns, shared by the Sharpe, Sortino and VaR calculations
+            returns = closed_trades['pnl_percentage'].to_numpy(dtype=np.float64) / 100
             
             # Calculate Sharpe ratio
-            if len(closed_trades) > 1:
-                returns = closed_trades['pnl_percentage'] / 100
-                sharpe_ratio = returns.mean() / returns.std() if returns.std() > 0 else 0
+            if len(returns) > 1:
+                returns_std = returns.std(ddof=1)
+                sharpe_ratio = returns.mean() / returns_std if returns_std > 0 else 0
             else:
                 sharpe_ratio = 0
             
             # Calculate additional metrics
             calmar_ratio = self._calculate_calmar_ratio(closed_trades, total_pnl, max_drawdown)
-            sortino_ratio = self._calculate_sortino_ratio(closed_trades)
+            sortino_ratio = self._calculate_sortino_ratio(returns)
             regime_metrics = self._calculate_regime_metrics(closed_trades)
-            risk_metrics = self._calculate_risk_metrics(closed_trades)
+            risk_metrics = self._calculate_risk_metrics(closed_trades, returns)
             
             metrics = {
                 'total_trades': total_trades,
@@ -329,20 +338,20 @@ class TradeLogger:
             self.logger.error(f"Error calculating Calmar ratio: {e}")
             return 0
     
-    def _calculate_sortino_ratio(self, trades_df):
-        """Calculate Sortino ratio"""
+    def _calculate_sortino_ratio(self, returns):
+        """Calculate Sortino ratio from per-trade returns"""
         try:
-            if trades_df.empty or len(trades_df) < 2:
+            if len(returns) < 2:
                 return 0
             
-            returns = trades_df['pnl_percentage'] / 100
             avg_return = returns.mean()
             negative_returns = returns[returns < 0]
             
-            if len(negative_returns) == 0:
+            # A sample deviation needs at least two losing trades
+            if len(negative_returns) < 2:
                 return 0
             
-            downside_deviation = negative_returns.std()
+            downside_deviation = negative_returns.std(ddof=1)
             
             if downside_deviation == 0:
                 return 0
@@ -384,18 +393,23 @@ class TradeLogger:
             self.logger.error(f"Error calculating regime metrics: {e}")
             return {}
     
-    def _calculate_risk_metrics(self, trades_df):
+    def _calculate_risk_metrics(self, trades_df, returns):
         """Calculate additional risk metrics"""
         try:
             if trades_df.empty:
                 return {}
             
-            # Value at Risk (VaR)
-            returns = trades_df['pnl_percentage'] / 100
-            var_95 = np.percentile(returns, 5) if len(returns) > 0 else 0
-            
-            # Expected Shortfall (Conditional VaR)
-            es_95 = returns[returns <= var_95].mean() if len(returns[returns <= var_95]) > 0 else 0
+            # Value at Risk (VaR): 5th percentile with linear interpolation,
+            # selecting the two neighbouring order statistics instead of sorting
+            rank = 0.05 * (len(returns) - 1)
+            lower = int(rank)
+            upper = min(lower + 1, len(returns) - 1)
+            selected = np.partition(returns, (lower, upper))
+            var_95 = selected[lower] + (selected[upper] - selected[lower]) * (rank - lower)
+            
+            # Expected Shortfall (Conditional VaR): mean of the returns at or below VaR
+            tail = returns[returns <= var_95]
+            es_95 = tail.mean() if len(tail) > 0 else 0
             
             # Maximum consecutive losses
             consecutive_losses = self._calculate_consecutive_losses(trades_df)